@@ -1,8 +1,11 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from math import isfinite, log as _mlog
 from typing import Dict, Tuple, Optional, Union, List
 import numpy as np
+import numba
 import matplotlib.pyplot as plt
-import networkx as nx
 from matplotlib.patches import Rectangle, Circle, Arrow, PathPatch, FancyArrowPatch
 import logging
 from rich.console import Console
@@ -11,7 +14,9 @@ from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.markdown import Markdown
 import random
+import sys
 from enum import Enum
+from types import MappingProxyType
 import colorsys
 
 # Configure logging
@@ -19,12 +24,96 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 console = Console()
 
+# slots=True is only accepted by dataclass on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class InputMode(Enum):
     MANUAL = "manual"
     AUTO = "auto"
     MIXED = "mixed"
 
-@dataclass
+# Physical constants for the Nernst equation
+_R = 8.314  # J/(mol*K)
+_F = 96485.0  # C/mol
+_R_OVER_2F = _R / (2 * _F)  # n = 2 electrons
+_T_KELVIN_OFFSET = 273.15
+_T_REF_K = 298.15
+
+# Solvent effect (simplified)
+_SOLVENT_FACTORS = {
+    "Water": 1.0,
+    "Methanol": 0.95,
+    "Ethanol": 0.90,
+    "DMSO": 1.1,
+    "Acetonitrile": 1.05
+}
+# Index-aligned solvent names and factors for use with _modify_potential_batch
+_SOLVENT_NAMES: List[str] = list(_SOLVENT_FACTORS)
+_SOLVENT_FACTOR_ARR: np.ndarray = np.array(list(_SOLVENT_FACTORS.values()), dtype=np.float64)
+
+@numba.njit(cache=True)
+def _modify_potential_kernel(base: float, T_C: float, pressure: float, pH: float,
+                             solvent_factor: float, catalyst_boost: float) -> float:
+    """Numerical core of EnvironmentSettings.modify_potential."""
+    # Convert Celsius to Kelvin
+    temperature_K = T_C + _T_KELVIN_OFFSET
+    
+    # Temperature effect (simplified Nernst equation modification)
+    temp_factor = temperature_K / _T_REF_K
+    
+    # Pressure effect (simplified)
+    pressure_factor = np.log(pressure)
+    
+    # pH effect
+    ph_factor = -0.059 * (pH - 7)
+    
+    return (base * temp_factor * solvent_factor + 
+            pressure_factor * 0.01 + ph_factor + catalyst_boost)
+
+@numba.njit(cache=True, parallel=True)
+def _modify_potential_batch_kernel(base: np.ndarray, T_C: np.ndarray, pressure: np.ndarray, pH: np.ndarray,
+                                   solvent_factor: np.ndarray, catalyst_boost: np.ndarray) -> np.ndarray:
+    """Apply the modify_potential kernel element-wise over equal-length 1-D condition arrays."""
+    n = base.shape[0]
+    # Numba does not bounds-check, so a short condition array would read out of bounds
+    if (T_C.shape[0] != n or pressure.shape[0] != n or pH.shape[0] != n or
+            solvent_factor.shape[0] != n or catalyst_boost.shape[0] != n):
+        raise ValueError("All condition arrays must have the same length as base")
+    out = np.empty(n)
+    for i in numba.prange(n):
+        out[i] = _modify_potential_kernel(base[i], T_C[i], pressure[i], pH[i],
+                                          solvent_factor[i], catalyst_boost[i])
+    return out
+
+def _modify_potential_batch(base, T_C, pressure, pH, solvent_factor, catalyst_boost) -> np.ndarray:
+    """Vectorized modify_potential over arrays or scalars broadcast to a common shape.
+    
+    Results are rounded to 3 decimals with np.round, exactly as EnvironmentSettings.modify_potential.
+    Raises ValueError if the inputs cannot be broadcast together.
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in
+                                   (base, T_C, pressure, pH, solvent_factor, catalyst_boost)))
+    shape = arrays[0].shape
+    flat = [np.ascontiguousarray(a).ravel() for a in arrays]
+    return np.round(_modify_potential_batch_kernel(*flat), 3).reshape(shape)
+
+@lru_cache(maxsize=1024)
+def _modify_potential_cached(base_potential: float, temperature: float, pressure: float,
+                             solvent: str, catalyst: Optional[str], pH: float) -> float:
+    """Memoized modify_potential keyed on primitive, hashable arguments."""
+    solvent_factor = _SOLVENT_FACTORS.get(solvent, 1.0)
+    
+    # Catalyst effect
+    catalyst_boost = 0.05 if catalyst else 0.0
+    
+    modified_potential = _modify_potential_kernel(
+        base_potential, float(temperature), float(pressure), float(pH),
+        solvent_factor, catalyst_boost)
+    
+    # np.round rather than built-in round so ties agree with _modify_potential_batch
+    return float(np.round(modified_potential, 3))
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EnvironmentSettings:
     temperature: float = 25.0  # Celsius
     pressure: float = 1.0  # atm
@@ -35,37 +124,10 @@ class EnvironmentSettings:
     
     def modify_potential(self, base_potential: float) -> float:
         """Modify potential based on environmental conditions."""
-        # Convert Celsius to Kelvin
-        temperature_K = self.temperature + 273.15
-        
-        # Temperature effect (simplified Nernst equation modification)
-        temp_factor = temperature_K / 298.15
-        
-        # Pressure effect (simplified)
-        pressure_factor = np.log(self.pressure)
-        
-        # pH effect
-        ph_factor = -0.059 * (self.pH - 7)
-        
-        # Solvent effect (simplified)
-        solvent_factors = {
-            "Water": 1.0,
-            "Methanol": 0.95,
-            "Ethanol": 0.90,
-            "DMSO": 1.1,
-            "Acetonitrile": 1.05
-        }
-        solvent_factor = solvent_factors.get(self.solvent, 1.0)
-        
-        # Catalyst effect
-        catalyst_boost = 0.05 if self.catalyst else 0.0
-        
-        modified_potential = (base_potential * temp_factor * solvent_factor + 
-                            pressure_factor * 0.01 + ph_factor + catalyst_boost)
-        
-        return round(modified_potential, 3)
+        return _modify_potential_cached(float(base_potential), self.temperature, self.pressure,
+                                        self.solvent, self.catalyst, self.pH)
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SimulationParameters:
     anode: str
     cathode: str
@@ -120,25 +182,48 @@ USAGE_GUIDE = """
 """
 
 # Standard Reduction Potentials (V) relative to SHE (Standard Hydrogen Electrode)
-STANDARD_REDUCTION_POTENTIALS = {
-    "Li": {"potential": -3.04},
-    "K": {"potential": -2.93},
-    "Ca": {"potential": -2.87},
-    "Na": {"potential": -2.71},
-    "Mg": {"potential": -2.37},
-    "Al": {"potential": -1.66},
-    "Zn": {"potential": -0.76},
-    "Fe": {"potential": -0.44},
-    "Ni": {"potential": -0.25},
-    "Sn": {"potential": -0.14},
-    "Pb": {"potential": -0.13},
-    "H2": {"potential": 0.00},  # Standard Hydrogen Electrode
-    "Cu": {"potential": 0.34},
-    "Ag": {"potential": 0.80},
-    "Hg": {"potential": 0.85},
-    "Pt": {"potential": 1.20},
-    "Au": {"potential": 1.50}
-}
+# Stored as parallel arrays: names and a contiguous potentials array, indexed via _NAME_TO_IDX
+_ELEMENT_NAMES: List[str] = [
+    "Li", "K", "Ca", "Na", "Mg", "Al", "Zn", "Fe", "Ni",
+    "Sn", "Pb",
+    "H2",  # Standard Hydrogen Electrode
+    "Cu", "Ag", "Hg", "Pt", "Au"
+]
+_NAME_TO_IDX: Dict[str, int] = {name: i for i, name in enumerate(_ELEMENT_NAMES)}
+_POTENTIALS: np.ndarray = np.array([
+    -3.04, -2.93, -2.87, -2.71, -2.37, -1.66, -0.76, -0.44, -0.25,
+    -0.14, -0.13,
+    0.00,
+    0.34, 0.80, 0.85, 1.20, 1.50
+], dtype=np.float64)
+
+class _PotentialsView(Mapping):
+    """Read-only, live mapping view of the potentials arrays in the legacy dict-of-dict shape."""
+    
+    def __getitem__(self, name: str) -> Mapping:
+        return MappingProxyType({"potential": float(_POTENTIALS[_NAME_TO_IDX[name]])})
+    
+    def __iter__(self):
+        return iter(_ELEMENT_NAMES)
+    
+    def __len__(self) -> int:
+        return len(_ELEMENT_NAMES)
+
+# Backwards-compatible view of the table above; reads always reflect _POTENTIALS
+STANDARD_REDUCTION_POTENTIALS = _PotentialsView()
+
+# Shared generator for batched random suggestions
+_RNG = np.random.default_rng()
+
+@lru_cache(maxsize=1)
+def _optimal_electrode_pair() -> Tuple[str, str]:
+    """Lowest/highest potential electrodes.
+    
+    STANDARD_REDUCTION_POTENTIALS is a read-only view, so the result can only change if
+    _POTENTIALS is modified in place; call cache_clear() after doing so.
+    """
+    order = np.argsort(_POTENTIALS)
+    return _ELEMENT_NAMES[order[0]], _ELEMENT_NAMES[order[-1]]
 
 class AdvancedElectrochemicalCell:
     def __init__(self):
@@ -146,41 +231,62 @@ class AdvancedElectrochemicalCell:
         
     def suggest_optimal_electrodes(self) -> Tuple[str, str]:
         """Suggest optimal electrode materials for maximum potential."""
-        electrodes = list(STANDARD_REDUCTION_POTENTIALS.items())
-        random.shuffle(electrodes)  # Randomize the selection
-        electrodes.sort(key=lambda x: x[1]['potential'])
-        return electrodes[0][0], electrodes[-1][0]  # Returns anode, cathode pair
+        return _optimal_electrode_pair()  # Returns anode, cathode pair
+    
+    def suggest_optimal_concentration_batch(self, is_anode: bool, n: int) -> np.ndarray:
+        """Suggest n optimal concentrations at once based on electrode role."""
+        if is_anode:
+            return _RNG.uniform(0.5, 1.0, n).round(2)  # Higher for anode
+        return _RNG.uniform(0.1, 0.5, n).round(2)  # Lower for cathode
     
     def suggest_optimal_concentration(self, is_anode: bool) -> float:
         """Suggest optimal concentration based on electrode role."""
-        if is_anode:
-            return round(random.uniform(0.5, 1.0), 2)  # Higher for anode
-        return round(random.uniform(0.1, 0.5), 2)  # Lower for cathode
+        return float(self.suggest_optimal_concentration_batch(is_anode, 1)[0])
+    
+    def suggest_optimal_moles_batch(self, cell_potentials: np.ndarray) -> np.ndarray:
+        """Suggest optimal moles for an array of cell potentials."""
+        return (np.asarray(cell_potentials, dtype=float) * 0.1).round(3)
     
     def suggest_optimal_moles(self, cell_potential: float) -> float:
         """Suggest optimal moles based on cell potential."""
         return round(cell_potential * 0.1, 3)
     
+    @classmethod
+    def calculate_cell_potential_batch(cls, anode_E0: np.ndarray, cathode_E0: np.ndarray,
+                                       conc_anode: np.ndarray, conc_cathode: np.ndarray,
+                                       T_C: np.ndarray) -> np.ndarray:
+        """Calculate cell potentials for arrays of conditions in one vectorized pass."""
+        # Convert Celsius to Kelvin
+        T_K = np.asarray(T_C, dtype=float) + _T_KELVIN_OFFSET
+        
+        # Enhanced Nernst equation with temperature correction
+        RT_nF = _R_OVER_2F * T_K
+        Q = np.asarray(conc_anode, dtype=float) / np.asarray(conc_cathode, dtype=float)
+        return (np.asarray(cathode_E0, dtype=float) - np.asarray(anode_E0, dtype=float)) - RT_nF * np.log(Q)
+    
     def calculate_cell_potential(self, params: SimulationParameters) -> float:
         """Calculate cell potential with environmental considerations."""
-        E0_anode = self.environment.modify_potential(
-            STANDARD_REDUCTION_POTENTIALS[params.anode]['potential'])
-        E0_cathode = self.environment.modify_potential(
-            STANDARD_REDUCTION_POTENTIALS[params.cathode]['potential'])
+        if params.conc_anode <= 0 or params.conc_cathode <= 0:
+            raise ValueError("Concentrations must be positive")
+        
+        E0_anode = self.environment.modify_potential(_POTENTIALS[_NAME_TO_IDX[params.anode]])
+        E0_cathode = self.environment.modify_potential(_POTENTIALS[_NAME_TO_IDX[params.cathode]])
         
         E0_cell = E0_cathode - E0_anode
         
         # Convert Celsius to Kelvin
-        temperature_K = self.environment.temperature + 273.15
+        temperature_K = self.environment.temperature + _T_KELVIN_OFFSET
         
         # Enhanced Nernst equation with temperature correction
-        RT_nF = (temperature_K * 8.314) / (2 * 96485)
+        RT_nF = _R_OVER_2F * temperature_K
         Q = params.conc_anode / params.conc_cathode
-        E_cell = E0_cell - RT_nF * np.log(Q)
+        E_cell = E0_cell - RT_nF * _mlog(Q)
         
         return round(E_cell, 3)
     
-    def get_half_reactions(self, anode: str, cathode: str) -> Tuple[str, str, str]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_half_reactions(anode: str, cathode: str) -> Tuple[str, str, str]:
         """Get half reactions and overall reaction equation for the galvanic cell."""
         half_reaction_anode = f"{anode}ⁿ⁺ + n e⁻ ⇌ {anode}"
         half_reaction_cathode = f"{cathode}ᵐ⁺ + m e⁻ ⇌ {cathode}"
@@ -191,20 +297,22 @@ class AdvancedElectrochemicalCell:
         """Get a summary of the overall reaction."""
         return f"The overall reaction suggests that {moles_anode} moles of {anode} are oxidized and {moles_cathode} moles of {cathode} ions are reduced, forming {cathode} metal and {anode} ions."
 
-import re
-
 def parse_scientific_notation(value: str) -> float:
     """Parse numbers written in standard or scientific notation."""
-    value = value.replace("x10^", "e")  # Convert formats like 1.5x10^-3 to 1.5e-3
-    if re.match(r"^-?\d+(\.\d+)?(e-?\d+)?$", value):
-        return float(value)
-    raise ValueError(f"Invalid number format: {value}")
+    value = value.replace("x10^", "e").replace("X10^", "e")  # Convert formats like 1.5x10^-3 to 1.5e-3
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"Invalid number format: {value}") from None
+    if not isfinite(number):  # float() also accepts "nan" and "inf"
+        raise ValueError(f"Invalid number format: {value}")
+    return number
 
 def get_user_input(prompt: str, allow_auto: bool = True) -> Union[str, float]:
     """Enhanced input handling with auto option."""
     while True:
         try:
-            value = console.input(prompt).strip().lower()
+            value = console.input(prompt).strip()
             if allow_auto and value == '':
                 return 'auto'
             return parse_scientific_notation(value)
@@ -214,19 +322,18 @@ def get_user_input(prompt: str, allow_auto: bool = True) -> Union[str, float]:
 
 def configure_environment() -> EnvironmentSettings:
     """Configure environmental parameters."""
-    env = EnvironmentSettings()
+    overrides = {}
     
     if Confirm.ask("Would you like to modify environmental parameters?"):
-        env.temperature = float(get_user_input("[cyan]Enter temperature (°C) [default=25]: [/cyan]") or 25)
-        env.pressure = float(get_user_input("[cyan]Enter pressure (atm) [default=1.0]: [/cyan]") or 1.0)
+        overrides["temperature"] = float(get_user_input("[cyan]Enter temperature (°C) [default=25]: [/cyan]") or 25)
+        overrides["pressure"] = float(get_user_input("[cyan]Enter pressure (atm) [default=1.0]: [/cyan]") or 1.0)
         
         # Solvent selection
-        solvents = ["Water", "Methanol", "Ethanol", "DMSO", "Acetonitrile"]
         console.print("[cyan]Available solvents:[/cyan]")
-        for i, solvent in enumerate(solvents, 1):
+        for i, solvent in enumerate(_SOLVENT_NAMES, 1):
             console.print(f"{i}. {solvent}")
         choice = int(get_user_input("[cyan]Select solvent (1-5) [default=1]: [/cyan]") or 1)
-        env.solvent = solvents[choice-1]
+        overrides["solvent"] = _SOLVENT_NAMES[choice-1]
         
         # Catalyst selection
         catalysts = ["None", "Platinum", "Palladium", "Nickel"]
@@ -234,27 +341,40 @@ def configure_environment() -> EnvironmentSettings:
         for i, catalyst in enumerate(catalysts):
             console.print(f"{i}. {catalyst}")
         choice = int(get_user_input("[cyan]Select catalyst (0-3) [default=0]: [/cyan]") or 0)
-        env.catalyst = None if choice == 0 else catalysts[choice]
+        overrides["catalyst"] = None if choice == 0 else catalysts[choice]
         
-        env.pH = float(get_user_input("[cyan]Enter pH [default=7.0]: [/cyan]") or 7.0)
+        overrides["pH"] = float(get_user_input("[cyan]Enter pH [default=7.0]: [/cyan]") or 7.0)
         
-    return env
+    return EnvironmentSettings(**overrides)
+
+# Reused across calls so repeated plots don't allocate a new Figure each time
+_FIG = None
+_AX = None
 
 def draw_galvanic_cell(anode: str, cathode: str, E_cell: float):
-    plt.figure(figsize=(10, 6))
-    
-    G = nx.DiGraph()
-    G.add_node(anode, pos=(0, 0), label=anode)
-    G.add_node(cathode, pos=(1, 0), label=cathode)
-    G.add_edge(anode, cathode, weight=E_cell)
+    global _FIG, _AX
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AX = plt.subplots(figsize=(10, 6))
+    else:
+        _AX.clear()
     
-    pos = nx.get_node_attributes(G, 'pos')
-    labels = nx.get_node_attributes(G, 'label')
+    # Fixed two-electrode layout: anode on the left, cathode on the right
+    positions = {anode: (0.0, 0.0), cathode: (1.0, 0.0)}
+    radius = 0.15
+    for label, (x, y) in positions.items():
+        _AX.add_patch(Circle((x, y), radius, facecolor='skyblue', edgecolor='skyblue'))
+        _AX.text(x, y, label, ha='center', va='center', fontsize=15, color='black', fontweight='bold')
     
-    nx.draw(G, pos, with_labels=True, labels=labels, node_size=3000, node_color='skyblue', font_size=15, font_color='black', font_weight='bold')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels={(anode, cathode): f"{E_cell} V"}, font_size=15)
+    _AX.add_patch(FancyArrowPatch((radius, 0.0), (1.0 - radius, 0.0),
+                                  arrowstyle='-|>', mutation_scale=20, color='black'))
+    _AX.text(0.5, 0.0, f"{E_cell} V", ha='center', va='center', fontsize=15,
+             bbox=dict(boxstyle='round', facecolor='white', edgecolor='white'))
     
-    plt.title("Galvanic Cell Diagram")
+    _AX.set_xlim(-0.5, 1.5)
+    _AX.set_ylim(-0.6, 0.6)
+    _AX.set_aspect('equal')
+    _AX.axis('off')
+    _AX.set_title("Galvanic Cell Diagram")
     plt.show()
 
 def main():
@@ -303,15 +423,17 @@ def main():
         )
 
     elif mode == 3:  # Mixed Mode
+        auto_anode, auto_cathode = cell.suggest_optimal_electrodes()
+        
         if random.choice([True, False]):
-            anode = cell.suggest_optimal_electrodes()[0]
+            anode = auto_anode
         else:
-            anode = console.input("[cyan]Enter anode material (or press Enter for auto): [/cyan]").strip() or cell.suggest_optimal_electrodes()[0]
+            anode = console.input("[cyan]Enter anode material (or press Enter for auto): [/cyan]").strip() or auto_anode
         
         if random.choice([True, False]):
-            cathode = cell.suggest_optimal_electrodes()[1]
+            cathode = auto_cathode
         else:
-            cathode = console.input("[cyan]Enter cathode material (or press Enter for auto): [/cyan]").strip() or cell.suggest_optimal_electrodes()[1]
+            cathode = console.input("[cyan]Enter cathode material (or press Enter for auto): [/cyan]").strip() or auto_cathode
         
         if random.choice([True, False]):
             conc_anode = cell.suggest_optimal_concentration(True)
@@ -347,7 +469,11 @@ def main():
         return
 
     # **Calculate and display results**
-    E_cell = cell.calculate_cell_potential(params)
+    try:
+        E_cell = cell.calculate_cell_potential(params)
+    except ValueError as e:
+        console.print(f"[red]{str(e)}. Exiting...[/red]")
+        return
     console.print(f"\n[bold green]Calculated Cell Potential: {E_cell} V[/bold green]")
     
     # Get and display half-reactions and overall reaction